@@ -10,7 +10,7 @@ from core.appdb.engine import get_session
 from core.config.writes import require_writes
 from core.policy.guard import require_owner_commit
 from core.appdb.models import Item, ItemBatch, Vendor
-from core.metrics.metric import UNIT_MULTIPLIER, default_unit_for, from_base
+from core.metrics.metric import UNIT_MULTIPLIER, default_unit_for, from_base, uom_multiplier_raw
 from tgc.security import require_token_ctx
 from tgc.state import AppState, get_state
 
@@ -126,7 +126,7 @@ def _items_with_onhand(db: Session):
 def _on_hand_fields(it: Item, on_hand: int) -> Dict[str, Any]:
     dimension = it.dimension if getattr(it, "dimension", None) in UNIT_MULTIPLIER else "count"
     unit = (getattr(it, "uom", None) or default_unit_for(dimension)).lower()
-    if unit not in UNIT_MULTIPLIER.get(dimension, {}):
+    if not uom_multiplier_raw(dimension, unit):
         unit = default_unit_for(dimension)
     try:
         display_qty = from_base(int(on_hand), unit, dimension)
@@ -267,7 +267,7 @@ def create_item(
     uom = (payload.get("uom") or payload.get("unit") or default_unit_for(dimension)).lower()
     if dimension not in UNIT_MULTIPLIER:
         raise HTTPException(status_code=400, detail="unsupported dimension")
-    if uom not in UNIT_MULTIPLIER.get(dimension, {}):
+    if not uom_multiplier_raw(dimension, uom):
         raise HTTPException(status_code=400, detail="unsupported uom")
     is_product = bool(payload.get("is_product"))
     price_val = payload.get("price")
@@ -358,7 +358,7 @@ def update_item(
     uom = (payload.get("uom") or payload.get("unit") or getattr(it, "uom", None) or default_unit_for(dimension)).lower()
     if dimension not in UNIT_MULTIPLIER:
         raise HTTPException(status_code=400, detail="unsupported dimension")
-    if uom not in UNIT_MULTIPLIER.get(dimension, {}):
+    if not uom_multiplier_raw(dimension, uom):
         raise HTTPException(status_code=400, detail="unsupported uom")
     price_val = payload.get("price")
     if payload.get("price_decimal") is not None:
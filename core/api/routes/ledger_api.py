@@ -25,11 +25,11 @@ from core.appdb.models import Item, ItemBatch, ItemMovement
 from core.appdb.paths import resolve_db_path
 from core.api.schemas_ledger import QtyDisplay, StockInReq, StockInResp
 from core.metrics.metric import (
-    UNIT_MULTIPLIER,
     _norm_unit,
     default_unit_for,
     from_base,
     to_base_qty,
+    uom_multiplier_raw,
 )
 
 # NOTE: Primary router uses legacy "/ledger" prefix; public_router exposes routes without it
@@ -375,8 +375,7 @@ def stock_in(payload: StockInReq, db: Session = Depends(get_session)):
 
     uom_raw = payload.uom
     uom = _norm_unit(uom_raw)
-    units_for_dim = UNIT_MULTIPLIER.get(item.dimension, {})
-    if item.dimension not in UNIT_MULTIPLIER or uom not in units_for_dim:
+    if uom_multiplier_raw(item.dimension, uom) == 0:
         raise HTTPException(
             status_code=400,
             detail={
@@ -504,7 +503,7 @@ def stock_in(payload: StockInReq, db: Session = Depends(get_session)):
         raise
 
     display_unit = item.uom or default_unit_for(getattr(item, "dimension", "count") or "count")
-    if item.dimension not in UNIT_MULTIPLIER or display_unit not in UNIT_MULTIPLIER[item.dimension]:
+    if not uom_multiplier_raw(item.dimension, display_unit):
         display_unit = default_unit_for(getattr(item, "dimension", "count") or "count")
     display_qty = from_base(int(on_hand), display_unit, item.dimension)
     fifo_disp = (
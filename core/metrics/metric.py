@@ -1,4 +1,7 @@
-from decimal import Decimal, ROUND_HALF_UP
+import sys
+from decimal import Context, Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Any, Iterable
 
 DIMENSIONS = {"length", "area", "volume", "weight", "count"}
 
@@ -13,33 +16,160 @@ UNIT_MULTIPLIER = {
 }
 
 
+# Flat (dimension, unit) -> multiplier view of UNIT_MULTIPLIER so lookups on
+# already-canonical keys cost a single dict probe. Keys are interned, and the
+# normalizers hand back these same key objects for known vocabulary, so key
+# comparison short-circuits on identity.
+_FLAT: dict[tuple[str, str], int] = {
+    (sys.intern(dim), sys.intern(unit)): mult for dim, units in UNIT_MULTIPLIER.items() for unit, mult in units.items()
+}
+# Canonical key objects by value. Only this closed vocabulary is interned;
+# arbitrary caller input is never added to the process-wide intern table.
+_CANONICAL_DIMS: dict[str, str] = {dim: dim for dim, _ in _FLAT}
+_CANONICAL_UNITS: dict[str, str] = {unit: unit for _, unit in _FLAT}
+_DECIMAL_MULT: dict[tuple[str, str], Decimal] = {key: Decimal(mult) for key, mult in _FLAT.items()}
+_DECIMAL_ONE = Decimal(1)
+_MILLI = Decimal("0.001")
+_NEG_ZERO_MILLI = Decimal("-0.000")
+_HALF_UP_CTX = Context(rounding=ROUND_HALF_UP)
+# Below this magnitude a whole float's repr and binary value are the same integer.
+_FLOAT_EXACT_INT = 2**53
+
+
+# ASCII lowercasing plus superscript digits in a single C-level pass.
+_UNIT_TRANS = str.maketrans({"²": "2", "³": "3", **{chr(c): chr(c + 32) for c in range(65, 91)}})
+
+
+@lru_cache(maxsize=64)
 def _norm_unit(u: str) -> str:
-    """Normalize unit strings such as m² / m^2 / m2 to the multiplier key."""
+    """Normalize unit strings such as m² / m^2 / m2 (or m³ / m^3) to the multiplier key."""
+
+    normalized = (u or "").translate(_UNIT_TRANS)
+    if not normalized.isascii():
+        normalized = normalized.lower()
+    if "^" in normalized:
+        normalized = normalized.replace("^2", "2").replace("^3", "3")
+    return _CANONICAL_UNITS.get(normalized, normalized)
+
 
-    return (u or "").lower().replace("²", "2").replace("^2", "2")
+@lru_cache(maxsize=64)
+def _norm_dimension(d: str) -> str:
+    """Normalize a dimension name, defaulting to count."""
+
+    normalized = (d or "count").lower()
+    return _CANONICAL_DIMS.get(normalized, normalized)
 
 
 def uom_multiplier(dimension: str, unit: str) -> int:
     """Safe accessor for UNIT_MULTIPLIER with unit normalization and fallbacks."""
 
-    dim = (dimension or "count").lower()
-    units = UNIT_MULTIPLIER.get(dim, {})
-    mult = units.get(_norm_unit(unit))
-    return mult if mult is not None else 1
+    mult = _FLAT.get((dimension, unit))
+    if mult is None:
+        mult = _FLAT.get((_norm_dimension(dimension), _norm_unit(unit)), 1)
+    return mult
+
+
+def uom_multiplier_raw(dimension: str, unit: str) -> int:
+    """Multiplier for already-canonical dimension/unit keys; 0 when unknown.
+
+    Skips normalization, so callers must pass validated keys (e.g. the output
+    of _norm_unit). Use uom_multiplier for free-text input.
+    """
+
+    return _FLAT.get((dimension, unit), 0)
+
+
+def _decimal_multiplier(dimension: str, unit: str) -> Decimal:
+    """Decimal counterpart of uom_multiplier, served from the prebuilt table."""
+
+    dmult = _DECIMAL_MULT.get((dimension, unit))
+    if dmult is None:
+        dmult = _DECIMAL_MULT.get((_norm_dimension(dimension), _norm_unit(unit)), _DECIMAL_ONE)
+    return dmult
 
 
 def to_base_qty(dimension: str, unit: str, qty_decimal: Decimal) -> int:
     """Convert a decimal quantity in the given UOM to base integer units."""
 
+    # Whole ints need no rounding; plain int math is exact.
+    if type(qty_decimal) is int:
+        return qty_decimal * uom_multiplier(dimension, unit)
+    dmult = _decimal_multiplier(dimension, unit)
+    return int(_HALF_UP_CTX.to_integral_value(Decimal(qty_decimal) * dmult))
+
+
+def _milli_from_base(qty_base: int, mult: int) -> Decimal:
+    """Integer-only equivalent of (qty_base / mult).quantize(_MILLI, ROUND_HALF_UP)."""
+
+    q, r = divmod(abs(qty_base) * 1000, mult)
+    if 2 * r >= mult:
+        q += 1
+    if qty_base < 0:
+        # Decimal division yields -0.000 for tiny negatives; keep that shape.
+        return Decimal(-q).scaleb(-3) if q else _NEG_ZERO_MILLI
+    return Decimal(q).scaleb(-3)
+
+
+def to_base_qty_batch(dimension: str, unit: str, values: Iterable[Any]) -> Any:
+    """Convert many quantities in one UOM to base integer units.
+
+    NumPy arrays (any shape) come back as int64 arrays of the same shape;
+    other iterables come back as lists. Results match to_base_qty element
+    by element. Integer arrays are multiplied exactly; float arrays are
+    scaled in float64 and rounded half away from zero in one vectorized
+    pass, with elements too close to a .5 boundary for float64 to decide
+    recomputed exactly. Object arrays (e.g. Decimals) go through
+    to_base_qty per element. OverflowError if a result does not fit in int64.
+    ndarray subclasses (e.g. np.matrix) come back as plain ndarrays; masked
+    arrays are rejected with TypeError rather than dropping their mask.
+    """
+
+    # NumPy is optional and never imported here: anyone holding an ndarray
+    # has already imported it.
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(values, np.ndarray):
+        return _to_base_qty_ndarray(np, dimension, unit, values)
+    return [to_base_qty(dimension, unit, v) for v in values]
+
+
+def _to_base_qty_ndarray(np: Any, dimension: str, unit: str, values: Any) -> Any:
+    ma = sys.modules.get("numpy.ma")
+    if ma is not None and isinstance(values, ma.MaskedArray):
+        raise TypeError("masked arrays are not supported; fill or compress them first")
+    values = np.asarray(values)
     mult = uom_multiplier(dimension, unit)
-    return int((Decimal(qty_decimal) * Decimal(mult)).to_integral_value(rounding=ROUND_HALF_UP))
+    if values.dtype.kind in "iu":
+        bound = np.iinfo(np.int64).max // mult
+        if values.size and (values.max() > bound or values.min() < -bound):
+            raise OverflowError("base quantity does not fit in int64")
+        return values.astype(np.int64) * mult
+    if values.dtype.kind == "f":
+        scaled = values.astype(np.float64) * mult
+        if not np.isfinite(scaled).all():
+            raise ValueError("quantities must be finite")
+        magnitude = np.abs(scaled)
+        whole = np.floor(magnitude)
+        frac = magnitude - whole
+        rounded = whole + (frac >= 0.5)
+        if (rounded >= 2.0**63).any():
+            raise OverflowError("base quantity does not fit in int64")
+        out = np.where(scaled < 0, -rounded, rounded).astype(np.int64)
+        # The float64 product can be off by up to one ulp, so a fraction that
+        # close to .5 may round the other way than the exact Decimal product.
+        near_tie = np.flatnonzero(np.abs(frac - 0.5) <= np.spacing(magnitude))
+        flat_in, flat_out = values.reshape(-1), out.reshape(-1)
+        for i in near_tie.tolist():
+            flat_out[i] = to_base_qty(dimension, unit, float(flat_in[i]))
+        return out
+    flat = [to_base_qty(dimension, unit, v) for v in values.ravel().tolist()]
+    return np.array(flat, dtype=np.int64).reshape(values.shape)
 
 
 def from_base_qty(dimension: str, unit: str, qty_base: int) -> Decimal:
-    mult = uom_multiplier(dimension, unit)
-    if mult == 0:
-        return Decimal(0)
-    return (Decimal(qty_base) / Decimal(mult)).quantize(Decimal("0.001"), rounding=ROUND_HALF_UP)
+    if type(qty_base) is int:
+        return _milli_from_base(qty_base, uom_multiplier(dimension, unit))
+    dmult = _decimal_multiplier(dimension, unit)
+    return (Decimal(qty_base) / dmult).quantize(_MILLI, rounding=ROUND_HALF_UP)
 
 DEFAULT_UNIT_FOR = {
     "length": "mm",
@@ -62,25 +192,40 @@ def default_unit_for(dimension: str) -> str:
     return DEFAULT_UNIT_FOR.get(dimension, "ea")
 
 
-def to_base(value_decimal: str | float | Decimal, unit: str, dimension: str) -> int:
-    if dimension not in DIMENSIONS:
-        raise ValueError(f"Unknown dimension: {dimension}")
-    units = UNIT_MULTIPLIER.get(dimension, {})
-    if unit not in units:
+def _mult_or_raise(dimension: str, unit: str) -> tuple[int, Decimal]:
+    """Strict (int, Decimal) multiplier lookup shared by to_base/from_base."""
+
+    key = (dimension, unit)
+    mult = _FLAT.get(key)
+    if mult is None:
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}")
         raise ValueError(f"Unit {unit} not valid for {dimension}")
-    d = Decimal(str(value_decimal))
-    mult = Decimal(units[unit])
-    return int((d * mult).to_integral_value(rounding=ROUND_HALF_UP))
+    return mult, _DECIMAL_MULT[key]
+
+
+def to_base(value_decimal: str | float | Decimal, unit: str, dimension: str) -> int:
+    """Strictly convert a value in ``unit`` to base integer units.
+
+    Floats are read via their shortest repr (what the user typed), not their
+    binary expansion, so HALF_UP ties round as written.
+    """
+
+    mult, dmult = _mult_or_raise(dimension, unit)
+    if isinstance(value_decimal, Decimal):
+        d = value_decimal
+    elif type(value_decimal) is float and value_decimal.is_integer() and abs(value_decimal) < _FLOAT_EXACT_INT:
+        return int(value_decimal) * mult
+    else:
+        d = Decimal(str(value_decimal))
+    return int(_HALF_UP_CTX.to_integral_value(d * dmult))
 
 
 def from_base(value_int: int, unit: str, dimension: str) -> Decimal:
-    if dimension not in DIMENSIONS:
-        raise ValueError(f"Unknown dimension: {dimension}")
-    units = UNIT_MULTIPLIER.get(dimension, {})
-    if unit not in units:
-        raise ValueError(f"Unit {unit} not valid for {dimension}")
-    mult = Decimal(units[unit])
-    return (Decimal(value_int) / mult).quantize(Decimal("0.001"), rounding=ROUND_HALF_UP)
+    mult, dmult = _mult_or_raise(dimension, unit)
+    if type(value_int) is int:
+        return _milli_from_base(value_int, mult)
+    return (Decimal(value_int) / dmult).quantize(_MILLI, rounding=ROUND_HALF_UP)
 
 
 def allowed_units_for(dimension: str) -> list[str]:
@@ -99,6 +244,8 @@ __all__ = [
     "from_base_qty",
     "to_base",
     "to_base_qty",
+    "to_base_qty_batch",
     "uom_multiplier",
+    "uom_multiplier_raw",
     "UNIT_MULTIPLIER",
 ]
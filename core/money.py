@@ -3,10 +3,12 @@
 
 from decimal import Decimal, ROUND_HALF_UP
 
+_ONE = Decimal("1")
+
 
 def round_half_up_cents(value: float) -> int:
     """Round a currency amount to cents using half-up semantics."""
-    quantized = Decimal(str(value)).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+    quantized = Decimal(str(value)).quantize(_ONE, rounding=ROUND_HALF_UP)
     return int(quantized)
 
 
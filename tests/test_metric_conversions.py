@@ -0,0 +1,198 @@
+# Copyright (C) 2025 BUS Core Authors
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from core.metrics.metric import (
+    UNIT_MULTIPLIER,
+    _norm_dimension,
+    _norm_unit,
+    from_base,
+    from_base_qty,
+    to_base,
+    to_base_qty,
+    to_base_qty_batch,
+    uom_multiplier,
+    uom_multiplier_raw,
+)
+
+
+def test_uom_multiplier_canonical_keys():
+    for dim, units in UNIT_MULTIPLIER.items():
+        for unit, mult in units.items():
+            assert uom_multiplier(dim, unit) == mult
+
+
+def test_uom_multiplier_normalizes_inputs():
+    assert uom_multiplier("AREA", "M²") == 1_000_000
+    assert uom_multiplier("area", "cm^2") == 100
+    assert uom_multiplier(None, "EA") == 1
+    assert uom_multiplier("Length", "CM") == 10
+    assert uom_multiplier("volume", "CM³") == 1_000
+    assert uom_multiplier("volume", "m^3") == 1_000_000_000
+
+
+def test_normalizers_only_return_canonical_objects_for_known_keys():
+    assert _norm_unit("".join(["C", "M", "²"])) is sys.intern("cm2")
+    assert _norm_dimension("".join(["Are", "a"])) is sys.intern("area")
+    unknown = "".join(["Furlong", "-x"])
+    assert _norm_unit(unknown) == "furlong-x"
+    assert _norm_unit(unknown) is not sys.intern("furlong-x")
+
+
+def test_uom_multiplier_unknown_falls_back_to_one():
+    assert uom_multiplier("length", "furlong") == 1
+    assert uom_multiplier("bogus", "mm") == 1
+
+
+def test_uom_multiplier_raw_requires_canonical_keys():
+    assert uom_multiplier_raw("area", "cm2") == 100
+    assert uom_multiplier_raw("area", "CM2") == 0
+    assert uom_multiplier_raw(None, "ea") == 0
+
+
+def test_to_base_qty_rounds_half_up():
+    assert to_base_qty("length", "cm", Decimal("1.25")) == 13
+    assert to_base_qty("length", "cm", Decimal("-1.25")) == -13
+    assert to_base_qty("weight", "kg", Decimal("0.0000005")) == 1
+    assert to_base_qty("area", "m²", Decimal("2")) == 2_000_000
+
+
+def test_to_base_qty_whole_inputs():
+    assert to_base_qty("length", "m", 3) == 3000
+    assert to_base_qty("length", "m", Decimal("3")) == 3000
+    assert to_base_qty("length", "m", Decimal("3E+2")) == 300_000
+    assert to_base_qty("length", "m", Decimal("3.0")) == 3000
+    assert to_base_qty("length", "cm", Decimal("-7.00")) == -70
+    assert to_base_qty("weight", "kg", -2) == -2_000_000
+
+
+def test_from_base_qty_quantizes_to_thousandths():
+    assert from_base_qty("length", "cm", 15) == Decimal("1.500")
+    assert str(from_base_qty("weight", "kg", 1_234_567)) == "1.235"
+    assert str(from_base_qty("count", "ea", 7)) == "7.000"
+    assert str(from_base_qty("weight", "g", 1_234_500)) == "1234.500"
+    assert str(from_base_qty("weight", "kg", 500)) == "0.001"
+    assert str(from_base_qty("weight", "kg", -500)) == "-0.001"
+    assert str(from_base_qty("weight", "kg", -499)) == "-0.000"
+    assert from_base_qty("length", "m", Decimal(2500)) == Decimal("2.500")
+
+
+def test_to_base_and_from_base_strict_units():
+    assert to_base("1.5", "m", "length") == 1500
+    assert to_base(1.0005, "m", "length") == 1001
+    assert to_base(2.0, "kg", "weight") == 2_000_000
+    assert to_base(1e23, "mm", "length") == 10**23
+    assert to_base(-1e16, "m", "length") == -(10**19)
+    assert to_base(9007199254740991.0, "mm", "length") == 2**53 - 1
+    assert to_base(Decimal("-0.0005"), "m", "length") == -1
+    assert str(from_base(1500, "m", "length")) == "1.500"
+    with pytest.raises(ValueError):
+        to_base("1", "M", "length")
+    with pytest.raises(ValueError):
+        from_base(1, "kg", "length")
+    with pytest.raises(ValueError):
+        from_base(1, "mm", "time")
+
+
+def test_to_base_qty_batch_iterable_matches_scalar():
+    values = [Decimal("1.25"), Decimal("-1.25"), 3, Decimal("0.04")]
+    expected = [to_base_qty("length", "cm", v) for v in values]
+    assert to_base_qty_batch("length", "cm", values) == expected
+
+
+def test_metric_import_does_not_load_numpy():
+    code = "import sys, core.metrics.metric; print('numpy' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_to_base_qty_batch_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    out = to_base_qty_batch("length", "cm", np.array([1.25, -1.25, 0.0, 2.04]))
+    assert out.dtype == np.int64
+    assert out.tolist() == [13, -13, 0, 20]
+
+    objs = np.array([Decimal("1.25"), Decimal("-0.05")], dtype=object)
+    assert to_base_qty_batch("length", "cm", objs).tolist() == [13, -1]
+
+    with pytest.raises(ValueError):
+        to_base_qty_batch("length", "cm", np.array([1.0, float("nan")]))
+
+
+def test_to_base_qty_batch_float_arrays_match_scalar():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(7)
+    samples = np.concatenate(
+        [
+            rng.uniform(-1e6, 1e6, 2000),
+            rng.uniform(-1, 1, 2000),
+            np.array([1.0005, -1.0005, 0.49999999999999994, 2.675, 1e-9]),
+        ]
+    )
+    for dim, unit in (("length", "m"), ("length", "mm"), ("weight", "kg"), ("area", "cm2")):
+        expected = [to_base_qty(dim, unit, v) for v in samples.tolist()]
+        assert to_base_qty_batch(dim, unit, samples).tolist() == expected
+        assert to_base_qty_batch(dim, unit, samples.tolist()) == expected
+
+
+def test_to_base_qty_batch_float_precision_and_shape():
+    np = pytest.importorskip("numpy")
+    assert to_base_qty_batch("weight", "kg", np.array([1.1], dtype=np.float16)).tolist() == [
+        to_base_qty("weight", "kg", float(np.float16(1.1)))
+    ]
+    single = np.array([16777.217], dtype=np.float32)
+    assert to_base_qty_batch("length", "m", single).tolist() == [to_base_qty("length", "m", float(single[0]))]
+    grid = to_base_qty_batch("length", "cm", np.array([[1.25, -1.25], [0.0, 2.0]]))
+    assert grid.shape == (2, 2)
+    assert grid.tolist() == [[13, -13], [0, 20]]
+
+
+def test_to_base_qty_batch_float_overflow_raises():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(OverflowError):
+        to_base_qty_batch("volume", "m3", np.array([1e12]))
+    with pytest.raises(OverflowError):
+        to_base_qty_batch("length", "m", np.array([float(2**62)]))
+
+
+def test_to_base_qty_batch_object_arrays_keep_shape():
+    np = pytest.importorskip("numpy")
+    grid = np.array([[Decimal("1.25"), Decimal("-0.05")], [Decimal("2"), 3]], dtype=object)
+    out = to_base_qty_batch("length", "cm", grid)
+    assert out.shape == (2, 2)
+    assert out.tolist() == [[13, -1], [20, 30]]
+    scalar = to_base_qty_batch("length", "cm", np.array(Decimal("1.25"), dtype=object))
+    assert scalar.shape == ()
+    assert int(scalar) == 13
+
+
+def test_to_base_qty_batch_ndarray_subclasses():
+    np = pytest.importorskip("numpy")
+    with pytest.warns(PendingDeprecationWarning):
+        mat = np.matrix([[1.25, -1.25], [2.0, 3.0]])
+    out = to_base_qty_batch("length", "cm", mat)
+    assert type(out) is np.ndarray
+    assert out.dtype == np.int64
+    assert out.tolist() == [[13, -13], [20, 30]]
+
+    for masked in (
+        np.ma.masked_array([1.25, 2.0], mask=[False, True]),
+        np.ma.masked_array([[1, 2], [3, 4]], mask=[[False, True], [False, False]]),
+    ):
+        with pytest.raises(TypeError):
+            to_base_qty_batch("length", "cm", masked)
+
+def test_to_base_qty_batch_integer_arrays_are_exact():
+    np = pytest.importorskip("numpy")
+    big = 9_000_000_000
+    out = to_base_qty_batch("volume", "m3", np.array([big, -3, 0], dtype=np.int64))
+    assert out.dtype == np.int64
+    assert out.tolist() == [big * 1_000_000_000, -3_000_000_000, 0]
+    assert to_base_qty_batch("weight", "g", np.array([2, 5], dtype=np.uint8)).tolist() == [2000, 5000]
+    with pytest.raises(OverflowError):
+        to_base_qty_batch("volume", "m3", np.array([10_000_000_000], dtype=np.int64))